@@ -14,20 +14,38 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import collections
 import io
 import json
+import os
 import pathlib
 import random
 import shutil
 import tkinter
 import typing
 import webbrowser
-from enum import Enum
-from tkinter import filedialog, ttk
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum, IntEnum
+from tkinter import filedialog, font, ttk
 
 import pygame
 from PIL import Image, ImageTk
-from tinytag import TinyTag
+from tinytag import TinyTag, TinyTagException
+
+# Optional, MP3 metadata is read with mutagen when it is installed
+try:
+    from mutagen import MutagenError
+    from mutagen.mp3 import EasyMP3
+except ImportError:
+    EasyMP3 = None
+
+# Optional, the tracks directory is watched with OS notifications when it is installed and polled otherwise
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
 
 backup_dir = pathlib.Path("backup")
 backup_settings = pathlib.Path("backup\\settings.json")
@@ -43,7 +61,10 @@ if not settings.exists() and not backup_settings.exists():
     default_settings = {
         "theme": 1,
         "directory": "tracks\\",
-        "volume": 50
+        "volume": 50,
+        "import_mode": "reference",
+        "references": [],
+        "audio_buffer": 4096
     }
 
     with open("settings.json", "w") as file:
@@ -52,13 +73,23 @@ if not settings.exists() and not backup_settings.exists():
 with open(settings, "r") as file:
     SETTINGS = json.load(file)
 
+# Added tracks are played from where they are ("reference") unless copying into the tracks directory is opted into ("copy")
+SETTINGS.setdefault("import_mode", "reference")
+SETTINGS.setdefault("references", [])
+# Larger buffers trade latency for fewer underruns, only read on startup
+SETTINGS.setdefault("audio_buffer", 4096)
+
 DEFAULT = {
     "title": "RePlay: MP3 Player",
     "geometry": "768x576", # Aspect Ratio 1.33 (4:3)
     "resizable": {"width": False, "height": False},
 }
 
-class Mode(Enum):
+TRACK_END = pygame.USEREVENT + 1
+ARTWORK_CACHE_SIZE = 16
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".ogg") # A tuple, so it can be passed to str.endswith
+
+class Mode(IntEnum):
     """An enumeration to define the theme modes for the music player.
 
     Attributes:
@@ -68,6 +99,21 @@ class Mode(Enum):
     LIGHT_MODE = 1
     DARK_MODE = 2
 
+THEME_COLORS = {
+    Mode.LIGHT_MODE: {
+        "background": "white",
+        "foreground": "black",
+        "listbox_highlight": "grey",
+        "trough": "lightgrey",
+    },
+    Mode.DARK_MODE: {
+        "background": "#2F3136",
+        "foreground": "white",
+        "listbox_highlight": "white",
+        "trough": "lightgrey",
+    },
+}
+
 class Repeat(Enum):
     """An enumeration to define the repeat modes for the music player.
 
@@ -80,6 +126,70 @@ class Repeat(Enum):
     ONE = 1
     ALL = 2
 
+class TracksEventHandler(FileSystemEventHandler):
+    """A watchdog event handler forwarding created, deleted, moved and written audio files in the tracks directory to the player.
+
+    The observer calls the handler on its own thread, so every change is handed to the Tk thread with after_idle.
+
+    Attributes:
+        player (Player): The player to notify of changes.
+    """
+    def __init__(self, player: "Player"):
+        """Initializes the handler for the given player.
+
+        Args:
+            player (Player): The player to notify of changes.
+        """
+        super().__init__()
+        self.player = player
+
+    def on_created(self, event: "FileSystemEvent") -> None:
+        """Forwards the path of a created audio file to the player.
+
+        Args:
+            event (FileSystemEvent): The event reported by the observer.
+        """
+        self.forward(event, event.src_path)
+
+    def on_deleted(self, event: "FileSystemEvent") -> None:
+        """Forwards the path of a deleted audio file to the player.
+
+        Args:
+            event (FileSystemEvent): The event reported by the observer.
+        """
+        self.forward(event, event.src_path)
+
+    def on_moved(self, event: "FileSystemEvent") -> None:
+        """Forwards both paths of a moved audio file to the player.
+
+        Args:
+            event (FileSystemEvent): The event reported by the observer.
+        """
+        self.forward(event, event.src_path, event.dest_path)
+
+    def on_closed(self, event: "FileSystemEvent") -> None:
+        """Forwards the path of an audio file closed after being written to the player, so copies are picked up once complete.
+
+        Args:
+            event (FileSystemEvent): The event reported by the observer.
+        """
+        self.forward(event, event.src_path)
+
+    def forward(self, event: "FileSystemEvent", *paths: str) -> None:
+        """Hands the given paths to the player on the Tk thread, ignoring directories and files that are not audio files.
+        Opening or reading a file is never forwarded, since the player reads tracks itself.
+
+        Args:
+            event (FileSystemEvent): The event reported by the observer.
+            *paths (str): The paths affected by the event.
+        """
+        if event.is_directory:
+            return
+
+        for path in paths:
+            if path.lower().endswith(AUDIO_EXTENSIONS):
+                self.player.after_idle(self.player.handle_fs_event, os.path.normpath(path))
+
 class Player(tkinter.Tk):
     """A class representing the main window of the MP3 player application, inheriting from tkinter.Tk.
     
@@ -90,31 +200,37 @@ class Player(tkinter.Tk):
     Attributes:
         playlist (dict): A dictionary storing the playlist where keys are track indices and values are track information.
         now_playing (dict): A dictionary storing information about the currently playing track.
-        existing_tracks (list): A list of paths to tracks that have been added to the playlist.
+        existing_tracks (set): A set of paths to tracks in the tracks directory that have been added to the playlist.
         volume (int): The current volume level of the player, loaded from settings.
-        track_progress (int): The current playback position of the currently playing track in seconds.
+        theme (dict): A dictionary mapping image names to the images of the current theme mode.
+        colors (dict): A dictionary mapping color roles to the colors of the current theme mode.
+        track_progress (float): The current playback position of the currently playing track in seconds.
         track_duration (int): The duration of the currently playing track in seconds.
+        seek_offset (float): The difference in seconds between the playback position and the mixer's play time, changed by seeking.
         is_muted (bool): A flag indicating whether the audio is currently muted.
         is_playing (bool): A flag indicating whether a track is currently playing.
         show_artwork (bool): A flag indicating whether the artwork of the currently playing track should be displayed.
         selected_index (int | None): The index of the currently selected track in the playlist, if any.
-        can_shuffle (bool): A flag indicating whether the playlist can be shuffled.
         can_reorder (bool): A flag indicating whether tracks in the playlist can be reordered.
-        can_edit (bool): A flag indicating whether the application is currently able to edit settings or track information.
+        settings_window (tkinter.Toplevel | None): The settings window, built the first time it is opened and hidden when closed.
+        file_watcher (str | None): The id of the pending directory poll when watchdog is not installed, if any.
     
     Methods:
         __init__(self): Initializes the Player class, setting up the main window, loading settings, and initializing audio playback.
+        load_theme_images(self, *modes: Mode) -> None: Loads the images of the given theme modes in parallel.
         mode(self) -> Mode: Gets the current theme mode of the application.
-        mode(self, value: str) -> None: Sets the theme mode of the application.
+        mode(self, value: Mode | str) -> None: Sets the theme mode of the application.
         repeat(self) -> Repeat: Gets the current repeat mode of the player.
         repeat(self, value: Repeat) -> None: Sets the repeat mode of the player.
         update_repeat(self) -> None: Cycles through the repeat modes of the music player.
         toggle_mute(self) -> None: Toggles the mute state of the player.
         readable_duration(self, duration: int | float) -> str: Converts a duration in seconds to a human-readable format.
-        update_track_progress(self): Updates the track's progress every second when a track is playing.
-        populate_track_info(self, path: pathlib.WindowsPath) -> int | None: Adds a track to the playlist and returns its index.
+        on_tick(self) -> None: Runs every 250 ms, updating the track's progress while a track is playing.
+        update_track_progress(self): Updates the track's progress from the mixer and advances once the track has ended.
+        queue_following_track(self) -> None: Queues the following track on the mixer for a gapless transition.
+        populate_track_info(self, path: str | pathlib.WindowsPath, reference: bool = False) -> int | None: Adds a track to the playlist and returns its index.
         play(self): Initiates playback of the current or first track in the playlist.
-        update_playing_track(self, index: int, track_info: dict) -> None: Updates the player with the currently selected track's information.
+        update_playing_track(self, index: int, track_info: dict, load: bool = True) -> None: Updates the player with the currently selected track's information.
         restart(self) -> None: Restarts the current track or plays the previous track if the current track has just started.
         previous(self) -> None: Plays the previous track in the playlist or restarts the current track.
         next(self, finished: bool = False) -> None: Advances to the next track in the playlist or handles repeat functionality.
@@ -124,11 +240,14 @@ class Player(tkinter.Tk):
         decrease_volume(self) -> None: Decreases the volume of the audio playback.
         increase_volume(self) -> None: Increases the volume of the audio playback.
         backup_settings(self) -> None: Backs up the settings.json file on startup.
-        load_backup(self) -> None: Loads the settings.json file from the backup.
         updating_volume(self) -> None: Updates the volume setting in the settings.json file.
+        save_settings(self, delay: int = 250) -> None: Schedules a debounced write of the settings.json file.
         adjust_volume(self, value: str) -> None: Adjusts the volume of the audio playback based on the slider value.
         toggle_artwork(self) -> None: Toggles the display of the artwork for the currently playing track.
         reorder_now_playing(self) -> None: Reorders the tracks in the UI and highlights the currently playing track.
+        reindex_playlist(self, tracks: typing.Iterable[dict] | None = None) -> None: Renumbers the playlist from 0.
+        mark_now_playing(self, index: int) -> None: Moves the now playing highlight in the UI to the given track.
+        track_string(self, index: int, track_info: dict, now_playing: bool = False) -> str: Builds the listbox text of a track.
         set_to_default(self) -> None: Resets the player UI to its default state when no track is playing.
         play_selected_track(self, event: tkinter.Event) -> None: Plays a track selected from the listbox.
         set_track_position(self, event: tkinter.Event): Sets the playback position based on user interaction with the progress bar.
@@ -136,24 +255,25 @@ class Player(tkinter.Tk):
         swap_track_index(self, event: tkinter.Event) -> None: Reorders tracks in the playlist based on drag-and-drop actions.
         remove_tracks(self) -> None: Removes selected tracks from the playlist and filesystem.
         add_tracks(self) -> None: Adds selected tracks to the playlist.
+        watch_tracks_directory(self) -> None: Starts watching the tracks directory for added or removed audio files.
+        handle_fs_event(self, path: str) -> None: Handles a change to an audio file reported by the directory observer.
     """
     playlist = {}
     now_playing = {}
 
-    existing_tracks = []
+    existing_tracks = set()
 
     volume = SETTINGS["volume"]
 
     track_progress = 0
     track_duration = 0
+    seek_offset = 0
 
     is_muted = False
     is_playing = False
     show_artwork = False
     selected_index = None
-    can_shuffle = True
     can_reorder = True
-    can_edit = True
 
     def __init__(self):
         """Initializes the Player class, setting up the main window, loading settings, initializing the pygame mixer for audio playback,
@@ -161,12 +281,45 @@ class Player(tkinter.Tk):
         """
         super().__init__()
         self._repeat = Repeat.OFF
-        self._mode = Mode(SETTINGS["theme"]).name.lower()
+        self._mode = Mode(SETTINGS["theme"])
+        self._is_light = self._mode is Mode.LIGHT_MODE
+        self.colors = THEME_COLORS[self._mode]
         self.startup_theme = tkinter.IntVar(value=SETTINGS["theme"])
+        self.settings_window = None
+        self.file_watcher = None
+
+        # Shared fonts, so Tk resolves each font once instead of once per widget
+        self.FONT_12 = font.Font(root=self, family="Times New Roman", size=12)
+        self.FONT_BOLD_12 = font.Font(root=self, family="Times New Roman", size=12, weight="bold")
+        self.FONT_BOLD_18 = font.Font(root=self, family="Times New Roman", size=18, weight="bold")
         
+        # Most tracks are 44.1 kHz stereo, matching it avoids resampling every block
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=SETTINGS["audio_buffer"])
         pygame.mixer.init()
+        pygame.display.init() # Required for the event queue, no window is opened
         self.mixer = pygame.mixer.music
         self.mixer.set_volume(self.volume / 100)
+        self.mixer.set_endevent(TRACK_END)
+
+        self._path_to_key = {}
+        self._now_playing_row = None
+        self._settings_dirty = False
+        self._settings_after = None
+        self._duration_cache = {}
+        self._queued = None
+        self._artwork_cache = collections.OrderedDict()
+        self._observer = None
+        self._fs_pending = {}
+        self._themed_mode_applied = None
+        self._swap_scheduled = False
+        self._reorder_pending = False
+        self._io_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        self._theme_handlers = {
+            tkinter.Listbox: self._theme_listbox,
+            tkinter.Button: self._theme_button,
+            tkinter.Label: self._theme_label,
+            tkinter.Scale: self._theme_scale,
+        }
         
         for key, value in DEFAULT.items():
             func = getattr(self, f"wm_{key}")
@@ -174,35 +327,60 @@ class Player(tkinter.Tk):
         
         self.wm_iconbitmap("assets\\icon.ico")
 
-        light_path = pathlib.Path("assets\\light_mode\\")
-        dark_path = pathlib.Path("assets\\dark_mode\\")
-        for file in light_path.iterdir():
-            if file.suffix in [".png"]:
-                name = file.stem.upper()
-                if "ALT_" in name:
-                    value = ImageTk.PhotoImage(Image.open(file).resize((256, 256)))
+        self._themes = {}
+        self.load_theme_images(Mode.LIGHT_MODE, Mode.DARK_MODE)
 
-                else:
-                    value = ImageTk.PhotoImage(Image.open(file).resize((32, 32)))
-                
-                setattr(self, f"{light_path.name}_{name}".upper(), value)
+        # The theme toggle shows the icon of the active theme
+        self._themes[Mode.LIGHT_MODE]["DARK_LIGHT"] = self._themes[Mode.LIGHT_MODE]["LIGHT"]
+        self._themes[Mode.DARK_MODE]["DARK_LIGHT"] = self._themes[Mode.DARK_MODE]["DARK"]
+        self.theme = self._themes[self._mode]
+
+        self.columnconfigure(8, weight=1)
+        self.rowconfigure(16, weight=1)
+
+        self.canvas()
+        self._tick = self.after(250, self.on_tick)
+        self.watch_tracks_directory()
+
+    def load_theme_images(self, *modes: Mode) -> None:
+        """Loads the images of the given theme modes in parallel on the I/O pool, skipping images that are already loaded.
+        The 256x256 images are only loaded for the active mode, the others are loaded once their mode is activated.
 
-        for file in dark_path.iterdir():
-            if file.suffix in [".png"]:
+        Args:
+            *modes (Mode): The theme modes to load.
+        """
+        pending = []
+        for mode in modes:
+            theme = self._themes.setdefault(mode, {})
+            for file in pathlib.Path(f"assets\\{mode.name.lower()}\\").iterdir():
                 name = file.stem.upper()
-                if "ALT_" in name:
-                    value = ImageTk.PhotoImage(Image.open(file).resize((256, 256)))
+                if file.suffix not in [".png"] or name in theme:
+                    continue
 
-                else:
-                    value = ImageTk.PhotoImage(Image.open(file).resize((32, 32)))
+                is_large = "ALT_" in name
+                if is_large and mode is not self._mode:
+                    continue
 
-                setattr(self, f"{dark_path.name}_{name}".upper(), value)
+                pending.append((mode, name, self._io_pool.submit(self._open_image, file, (256, 256) if is_large else (32, 32))))
 
-        self.columnconfigure(8, weight=1)
-        self.rowconfigure(16, weight=1)
+        # PhotoImages are Tk objects, so they are only created on the Tk thread
+        for mode, name, future in pending:
+            value = ImageTk.PhotoImage(future.result())
+            self._themes[mode][name] = value
 
-        self.canvas()
-        self.watchdog()
+    @staticmethod
+    def _open_image(file: pathlib.Path, size: typing.Tuple[int, int]) -> Image.Image:
+        """Opens and resizes an image, safe to run outside of the Tk thread.
+
+        Args:
+            file (pathlib.Path): The path of the image file.
+            size (typing.Tuple[int, int]): The size to resize the image to.
+
+        Returns:
+            Image.Image: The resized image.
+        """
+        with Image.open(file) as image:
+            return image.resize(size)
 
     @property
     def mode(self) -> Mode:
@@ -214,19 +392,26 @@ class Player(tkinter.Tk):
         return self._mode
 
     @mode.setter
-    def mode(self, value: str) -> int:
+    def mode(self, value: Mode | str) -> None:
         """Sets the application's theme mode to either light or dark.
 
         Args:
-            value (str): The theme mode to set. Must be either 'light_mode' or 'dark_mode'.
+            value (Mode | str): The theme mode to set. Must be a Mode, or either 'light_mode' or 'dark_mode'.
 
         Raises:
-            ValueError: If the provided value is not 'light_mode' or 'dark_mode'.
+            ValueError: If the provided value is not a Mode, 'light_mode' or 'dark_mode'.
         """
-        if value not in ["light_mode", "dark_mode"]:
-            raise ValueError("Mode must be 'light_mode' or 'dark_mode'")
+        if isinstance(value, str) and value.upper() in Mode.__members__:
+            value = Mode[value.upper()]
+
+        if not isinstance(value, Mode):
+            raise ValueError("Mode must be a Mode, 'light_mode' or 'dark_mode'")
 
         self._mode = value
+        self._is_light = value is Mode.LIGHT_MODE
+        self.colors = THEME_COLORS[value]
+        self.load_theme_images(value)
+        self.theme = self._themes[value]
         self.update_theme()
 
     @property
@@ -253,13 +438,15 @@ class Player(tkinter.Tk):
 
         self._repeat = value
         if self._repeat == Repeat.OFF:
-            self.repeat_button.configure(image=self.LIGHT_MODE_REPEAT if self.mode == "light_mode" else self.DARK_MODE_REPEAT)
+            self.repeat_button.configure(image=self.theme["REPEAT"])
 
         elif self._repeat == Repeat.ONE:
-            self.repeat_button.configure(image=self.LIGHT_MODE_REPEAT_TRACK if self.mode == "light_mode" else self.DARK_MODE_REPEAT_TRACK)
+            self.repeat_button.configure(image=self.theme["REPEAT_TRACK"])
 
         else:
-            self.repeat_button.configure(image=self.LIGHT_MODE_REPEAT_ALL if self.mode == "light_mode" else self.DARK_MODE_REPEAT_ALL)
+            self.repeat_button.configure(image=self.theme["REPEAT_ALL"])
+
+        self._requeue_following_track()
 
     def update_repeat(self) -> None:
         """Cycles through the repeat modes of the music player.
@@ -281,12 +468,12 @@ class Player(tkinter.Tk):
         """
         if not self.is_muted:
             self.is_muted = True
-            self.muted_unmuted.config(image=self.LIGHT_MODE_MUTED if self.mode == "light_mode" else self.DARK_MODE_MUTED)
+            self.muted_unmuted.config(image=self.theme["MUTED"])
             self.mixer.set_volume(0)
 
         else:
             self.is_muted = False
-            self.muted_unmuted.config(image=self.LIGHT_MODE_UNMUTED if self.mode == "light_mode" else self.DARK_MODE_UNMUTED)
+            self.muted_unmuted.config(image=self.theme["UNMUTED"])
             self.mixer.set_volume(self.volume / 100)
     
     def readable_duration(self, duration: int | float) -> str:
@@ -298,82 +485,283 @@ class Player(tkinter.Tk):
         Returns:
             str: The duration formatted as a string in HH:MM:SS format.
         """
-        hours = int(duration / 3600)
-        minutes = int((duration - hours * 3600) / 60)
-        seconds = int((duration - hours * 3600 - minutes * 60))
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+        duration = int(duration)
+        readable = self._duration_cache.get(duration)
+        if readable:
+            return readable
+
+        hours, remainder = divmod(duration, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        readable = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+        # Cheap to rebuild, so the cache is simply dropped once it grows too large
+        if len(self._duration_cache) > 8192:
+            self._duration_cache.clear()
+
+        self._duration_cache[duration] = readable
+        return readable
+
+    def on_tick(self) -> None:
+        """Runs every 250 ms for the lifetime of the window, updating the track's progress while a track is playing.
+        """
+        # Rescheduled first, so a track that fails to load or queue can not stop the tick for the rest of the session
+        self._tick = self.after(250, self.on_tick)
+        if self.is_playing and self.now_playing:
+            self.update_track_progress()
 
     def update_track_progress(self):
-        """Updates the track's progress every second when a track is playing.
+        """Updates the track's progress from the mixer, and advances to the next track once the mixer posts its end event.
         """
-        try:
-            self.after_cancel(self.repeater)
-        except AttributeError:
-            ...
+        for event in pygame.event.get():
+            if event.type != TRACK_END:
+                continue
 
-        if self.is_playing:
-            if self.track_progress < self.track_duration:
-                self.track_progress += 1
-                self.track_position.configure(value=self.track_progress)
-                self.track_duration_text.configure(text=self.readable_duration(self.track_duration - self.track_progress))
-                self.updater = self.after(1000, self.update_track_progress)
-            
-            elif self.track_progress >= self.track_duration:
+            if not self.mixer.get_busy():
                 self.next(finished=True)
-            
+                return
+
+            # The queued track has taken over, stale events from loading a new track find nothing queued
+            if self._queued is not None:
+                queued, self._queued = self._queued, None
+                index = self._path_to_key.get(queued["path_key"])
+                if index is None:
+                    self.next(finished=True)
+                else:
+                    self.update_playing_track(index, queued, load=False)
+
+                return
+
+        self.track_progress = min(self.seek_offset + max(self.mixer.get_pos(), 0) / 1000, self.track_duration)
+        self.track_position.configure(value=self.track_progress)
+        self.track_duration_text.configure(text=self.readable_duration(self.track_duration - self.track_progress))
+
+        if self._queued is None and self.track_progress >= self.track_duration - 10:
+            self.queue_following_track()
+
+    def queue_following_track(self) -> None:
+        """Queues the track that follows the currently playing one on the mixer, so it starts without a gap once the current track ends.
+        """
+        following = self._following_track()
+        if following is None:
+            return
+
+        self.mixer.queue(following["path"])
+        self._queued = following
+
+    def _following_track(self) -> dict | None:
+        """Gets the track that follows the currently playing one under the current repeat mode.
+
+        Returns:
+            dict | None: The following track's information, None if playback stops after the current track.
+        """
+        index, track_info = self.get_now_playing()
+        if self.repeat == Repeat.ONE:
+            return track_info
+
+        if index + 1 in self.playlist:
+            return self.playlist[index + 1]
+
+        if self.repeat == Repeat.ALL and self.playlist:
+            return self.playlist[next(iter(self.playlist))]
+
+    def _requeue_following_track(self) -> None:
+        """Replaces the track queued on the mixer once the repeat mode or the playlist has changed. Queueing a track replaces the
+        queued one, but pygame can not unqueue, so the playing track is reloaded at its position when nothing should follow it any more.
+        """
+        if self._queued is None or not self.now_playing:
+            return
+
+        following = self._following_track()
+        if following is self._queued:
+            return
+
+        if following is not None:
+            self.mixer.queue(following["path"])
+
         else:
-            self.repeater = self.after(1000, self.update_track_progress)
+            _, track_info = self.get_now_playing()
+            position = self.seek_offset + max(self.mixer.get_pos(), 0) / 1000
+            self.mixer.load(track_info["path"])
+            self.mixer.play(start=position)
+            self.seek_offset = position
+            if not self.is_playing:
+                self.mixer.pause()
+
+        self._queued = following
 
-    def populate_track_info(self, path: pathlib.WindowsPath) -> int | None:
+    def populate_track_info(self, path: str | pathlib.WindowsPath, reference: bool = False) -> int | None:
         """Populates the track information into the playlist from a given file path.
 
         Args:
-            path (pathlib.WindowsPath): The file path of the audio track to be added to the playlist.
+            path (str | pathlib.WindowsPath): The file path of the audio track to be added to the playlist.
+            reference (bool): Whether the track is referenced in place rather than stored in the tracks directory. Defaults to False.
 
         Returns:
             int | None: The index of the track in the playlist if added successfully, None if the track is already in the playlist.
         """
-        track_path = path.as_posix().replace("/", "\\")
-        index = len(self.playlist)
-        audio = TinyTag.get(track_path, image=True)
-        title = audio.title
-        album = audio.album
-        artist = audio.artist
-        duration = audio.duration
-        artwork = audio.get_image()
-
-        for _, track_info in self.playlist.items():
-            if track_info["path"] == track_path:
-                return
-        
-        try:
-            track_path: pathlib.WindowsPath = shutil.copy2(track_path, pathlib.Path(SETTINGS["directory"]))
-        except shutil.SameFileError:
-            ...
-        
-        if track_path not in self.existing_tracks:
-            self.existing_tracks.append(track_path)
-
-        min_max_coordinates = 396 / duration
-        coordinate_ranges = {}
-        start = 0
-        end = min_max_coordinates
-        for segment in range(round(duration)):
-            coordinate_ranges[segment] = (start, end)
-            start = end
-            end += min_max_coordinates
-
-        self.playlist[index] = {
+        if self._path_key(path) in self._path_to_key:
+            return
+
+        return self._install_track(self._parse_track(path), reference)
+
+    def _parse_track(self, path: str | pathlib.WindowsPath, copy: bool = False) -> dict:
+        """Reads a track's metadata, optionally copying it into the tracks directory first. Does not touch any Tk state, so it can run on the I/O pool.
+
+        Args:
+            path (str | pathlib.WindowsPath): The file path of the audio track to be parsed.
+            copy (bool): Whether to copy the track into the tracks directory. Defaults to False.
+
+        Returns:
+            dict: The track's information, ready to be installed into the playlist.
+        """
+        track_path = os.path.normpath(path)
+        title, album, artist, duration = self._read_tags(track_path)
+
+        if copy:
+            track_path = self._copy_track(track_path, SETTINGS["directory"])
+
+        return {
             "album": album,
             "artist": artist,
             "duration": duration,
             "title": title,
-            "artwork": ImageTk.PhotoImage(Image.open(io.BytesIO(artwork)).resize((256, 256))) if artwork else None,
             "path": track_path,
-            "coordinates": coordinate_ranges,
+            "path_key": self._path_key(track_path),
+            "px_per_sec": 396 / duration if duration else 0,
+            "display": " - ".join([title or "", *(part for part in (album, artist) if part)]),
         }
 
+    @staticmethod
+    def _copy_track(track_path: str, directory: str) -> str:
+        """Copies a track into a directory with a 1 MiB buffer, keeping its timestamps. The copy only appears under its final name
+        once complete. Safe to run outside of the Tk thread.
+
+        Args:
+            track_path (str): The file path of the audio track.
+            directory (str): The directory to copy the track into.
+
+        Returns:
+            str: The file path of the copy, or the original path if the track is already in the directory.
+        """
+        destination = os.path.normpath(os.path.join(directory, os.path.basename(track_path)))
+        if os.path.exists(destination) and os.path.samefile(track_path, destination):
+            return track_path
+
+        # Written under a name the watchers ignore, so a half-copied file is never picked up
+        partial = destination + ".part"
+        with open(track_path, "rb") as source, open(partial, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+
+        shutil.copystat(track_path, partial)
+        os.replace(partial, destination)
+        return destination
+
+    @staticmethod
+    def _read_tags(track_path: str) -> typing.Tuple[str | None, str | None, str | None, float]:
+        """Reads the title, album, artist and duration of a track without its artwork. MP3s are read with mutagen when it is
+        installed, everything else, and anything mutagen fails on, with TinyTag.
+
+        Args:
+            track_path (str): The file path of the audio track.
+
+        Returns:
+            typing.Tuple[str | None, str | None, str | None, float]: The title, album, artist and duration in seconds of the track,
+            0.0 if the duration is unknown.
+        """
+        if EasyMP3 is not None and track_path.lower().endswith(".mp3"):
+            try:
+                audio = EasyMP3(track_path)
+            except MutagenError:
+                ...
+            else:
+                tags = audio.tags or {}
+                title, album, artist = ((tags.get(key) or [None])[0] for key in ("title", "album", "artist"))
+                return title, album, artist, audio.info.length or 0.0
+
+        audio = TinyTag.get(track_path, image=False)
+        return audio.title, audio.album, audio.artist, audio.duration or 0.0
+
+    def _install_track(self, track_info: dict, reference: bool = False) -> int | None:
+        """Adds parsed track information to the end of the playlist. Must run on the Tk thread.
+
+        Args:
+            track_info (dict): The track's information as returned by _parse_track.
+            reference (bool): Whether the track is referenced in place rather than stored in the tracks directory. Defaults to False.
+
+        Returns:
+            int | None: The index of the track in the playlist if added successfully, None if the track is already in the playlist.
+        """
+        track_path = track_info["path"]
+        path_key = track_info["path_key"]
+        if path_key in self._path_to_key:
+            return
+
+        if reference:
+            if track_path not in SETTINGS["references"]:
+                SETTINGS["references"].append(track_path)
+                self.save_settings()
+
+        else:
+            self.existing_tracks.add(track_path)
+
+        index = len(self.playlist)
+        self.playlist[index] = track_info
+        self._path_to_key[path_key] = index
         return index
+
+    @staticmethod
+    def _path_key(path: str | pathlib.Path) -> str:
+        """Normalizes a path for comparisons, so the same file matches regardless of separators or, on Windows, letter case.
+
+        Args:
+            path (str | pathlib.Path): The path to normalize.
+
+        Returns:
+            str: The absolute, case-normalized path.
+        """
+        return os.path.normcase(os.path.abspath(path))
+
+    def _install_tracks(self, futures: typing.List[Future], reference: bool) -> None:
+        """Installs the tracks parsed on the I/O pool, in the order they were selected.
+
+        Args:
+            futures (typing.List[Future]): The pending _parse_track futures, in selection order. Installed futures are removed from the list.
+            reference (bool): Whether the tracks are referenced in place rather than copied into the tracks directory.
+        """
+        installed = False
+        while futures and futures[0].done():
+            # A file that can not be read or copied is skipped, so the tracks selected after it are still installed
+            try:
+                track_info = futures.pop(0).result()
+            except (TinyTagException, OSError):
+                continue
+
+            if self._install_track(track_info, reference) is not None:
+                installed = True
+
+        if installed:
+            self.reorder_now_playing()
+
+    def _get_artwork(self, track_info: dict) -> ImageTk.PhotoImage | None:
+        """Gets the artwork of a track, reading and decoding it on first use. Only the most recently used artworks are kept decoded.
+
+        Args:
+            track_info (dict): A dictionary containing the track's metadata, including its path.
+
+        Returns:
+            ImageTk.PhotoImage | None: The artwork of the track, None if the track has no embedded artwork.
+        """
+        path = track_info["path"]
+        if path in self._artwork_cache:
+            self._artwork_cache.move_to_end(path)
+            return self._artwork_cache[path]
+
+        artwork = TinyTag.get(path, image=True).get_image()
+        self._artwork_cache[path] = ImageTk.PhotoImage(Image.open(io.BytesIO(artwork)).resize((256, 256))) if artwork else None
+        if len(self._artwork_cache) > ARTWORK_CACHE_SIZE:
+            self._artwork_cache.popitem(last=False)
+
+        return self._artwork_cache[path]
     
     def play(self):
         """Initiates playback of the current track in the playlist or the first track if no track is currently playing.
@@ -382,26 +770,22 @@ class Player(tkinter.Tk):
             index, track_info = self.get_now_playing()
             self.update_playing_track(index, track_info)
         
-        elif not self.now_playing and self.existing_tracks:
+        elif not self.now_playing and self.playlist:
             self.update_playing_track(0, self.playlist[0])
 
-    def update_playing_track(self, index: int, track_info: dict) -> None:
+    def update_playing_track(self, index: int, track_info: dict, load: bool = True) -> None:
         """Updates the player with the currently selected track's information and initiates playback.
 
         Args:
             index (int): The index of the currently selected track in the playlist.
             track_info (dict): A dictionary containing the track's metadata, including title, album, artist, duration, and artwork.
+            load (bool): Whether to load and play the track, False when the mixer already started it from the queue. Defaults to True.
         """
-        try:
-            self.after_cancel(self.updater)
-        except AttributeError:
-            ...
-
         self.now_playing.clear()
 
         title = track_info["title"]
         album = track_info["album"]
-        artwork = track_info["artwork"]
+        artwork = self._get_artwork(track_info)
         artist = track_info["artist"]
         duration = track_info["duration"]
         path = track_info["path"]
@@ -409,26 +793,27 @@ class Player(tkinter.Tk):
         self.now_playing[index] = track_info
         self.track_duration = duration
         self.track_progress = 0
+        self.seek_offset = 0
         self.is_playing = True
+        self._queued = None
 
-        self.reorder_now_playing()
+        self.mark_now_playing(index)
 
         self.track_title.configure(text=f"{title or 'N/A'} {f'- {album}' if album else ''}")
         if artwork:
             self.artwork.configure(image=artwork)
             self.show_artwork = True
         else:
-            self.artwork.configure(image=self.LIGHT_MODE_ALT_ARTWORK if self.mode == "light_mode" else self.DARK_MODE_ARTWORK)
+            self.artwork.configure(image=self.theme["ALT_ARTWORK"])
             
         self.track_artist.configure(text=artist or "N/A")
         self.track_duration_text.configure(text=self.readable_duration(duration))
-        self.play_pause_button.configure(image=self.LIGHT_MODE_PAUSE if self.mode == "light_mode" else self.DARK_MODE_PAUSE)
-        self.track_position.configure(maximum=duration)
-
-        self.update_track_progress()
+        self.play_pause_button.configure(image=self.theme["PAUSE"])
+        self.track_position.configure(maximum=duration, value=0)
         
-        self.mixer.load(path)
-        self.mixer.play(fade_ms=3000)
+        if load:
+            self.mixer.load(path)
+            self.mixer.play(fade_ms=3000)
 
     def restart(self) -> None:
         """Restarts the current track if it has been playing for more than 2 seconds, otherwise plays the previous track.
@@ -439,20 +824,13 @@ class Player(tkinter.Tk):
             return
 
         index, _ = self.get_now_playing()
-        track_info = self.playlist.get(index - 1)
-        last_index = list(self.playlist)[-1]
+        previous_index = index - 1
+        self.now_playing.clear()
 
-        if not track_info:
-            self.now_playing.clear()
-            if index <= index:
-                self.update_playing_track(last_index, self.playlist[last_index])
-                return
-            
-            self.play()
-        
-        else:
-            self.now_playing.clear()
-            self.update_playing_track(index - 1, track_info)
+        if previous_index not in self.playlist:
+            previous_index = next(reversed(self.playlist))
+
+        self.update_playing_track(previous_index, self.playlist[previous_index])
 
     def previous(self) -> None:
         """Handles the action to play the previous track in the playlist or restart the current track.
@@ -473,20 +851,19 @@ class Player(tkinter.Tk):
             self.play()
             return
 
-        index, _ = self.get_now_playing()
-        track_info = self.playlist.get(index + 1)
+        index, track_info = self.get_now_playing()
+        next_index = index + 1
 
-        if self.repeat == Repeat.ONE and self.track_progress >= self.track_duration:
-            index, track_info = self.get_now_playing()
+        if self.repeat == Repeat.ONE and finished:
             self.update_playing_track(index, track_info)
     
-        elif not track_info:
+        elif next_index not in self.playlist:
             self.now_playing.clear()
             if self.repeat == Repeat.OFF and finished:
-                self.play_pause_button.configure(image=self.LIGHT_MODE_PLAY if self.mode == "light_mode" else self.DARK_MODE_PLAY)
-                self.after_cancel(self.updater)
+                self.play_pause_button.configure(image=self.theme["PLAY"])
+                self.is_playing = False
 
-            elif list(self.playlist)[-1] >= index:
+            elif next(reversed(self.playlist)) >= index:
                 self.update_playing_track(0, self.playlist[0])
 
             else:
@@ -494,19 +871,19 @@ class Player(tkinter.Tk):
         
         else:
             self.now_playing.clear()
-            self.update_playing_track(index + 1, track_info)
+            self.update_playing_track(next_index, self.playlist[next_index])
 
     def toggle_playback(self) -> None:
         """Toggles the playback state of the media player.
         """
         if self.is_playing:
             self.is_playing = False
-            self.play_pause_button.config(image=self.LIGHT_MODE_PLAY if self.mode == "light_mode" else self.DARK_MODE_PLAY)
+            self.play_pause_button.config(image=self.theme["PLAY"])
             self.mixer.pause()
             return
 
         self.is_playing = True
-        self.play_pause_button.config(image=self.LIGHT_MODE_PAUSE if self.mode == "light_mode" else self.DARK_MODE_PAUSE)
+        self.play_pause_button.config(image=self.theme["PAUSE"])
         if self.playlist and not self.now_playing:
             self.play()
 
@@ -525,14 +902,10 @@ class Player(tkinter.Tk):
     def shuffle_tracks(self) -> None:
         """Shuffles the tracks in the playlist and updates the display order.
         """
-        if not self.can_shuffle:
-            return
-
-        self.can_shuffle = False
-        random.shuffle(self.playlist)
+        tracks = list(self.playlist.values())
+        random.shuffle(tracks)
+        self.reindex_playlist(tracks)
         self.reorder_now_playing()
-        
-        self.can_shuffle = True
     
     def decrease_volume(self) -> None:
         """Decreases the volume of the audio playback by 10 units.
@@ -565,33 +938,42 @@ class Player(tkinter.Tk):
         except shutil.Error:
             ...
 
-    def load_backup(self) -> None:
-        """Loads the settings.json file from the backup folder.
+    def updating_volume(self) -> None:
+        """Updates the volume setting, writing the settings.json file once the volume has stopped changing for 250 ms.
         """
-        shutil.copyfile("backup\\settings.json", "settings.json")
+        if SETTINGS["volume"] == self.volume:
+            return
 
-    def updating_volume(self) -> None:
-        """Updates the volume setting in the settings.json file and handles automatic backup and retry mechanisms.
-        """    
-        try:
-            self.after_cancel(self.volume_updater)
-        except AttributeError:
-            ...
+        SETTINGS["volume"] = self.volume
+        self.save_settings()
 
-        if self.can_edit:
-            self.can_edit = False
-            try:
-                with open("settings.json", "w") as file:
-                    SETTINGS["volume"] = self.volume
-                    json.dump(SETTINGS, file, indent=4)
-            except KeyError:
-                self.load_backup()
-                self.updating_volume()
-                
-            self.can_edit = True
-        
-        else:
-            self.volume_updater = self.after(15000, self.updating_volume)
+    def save_settings(self, delay: int = 250) -> None:
+        """Marks the settings as changed and schedules the settings.json file to be written once no further change has been made for the given delay.
+
+        Args:
+            delay (int): The delay in milliseconds before the settings are written. Defaults to 250.
+        """
+        self._settings_dirty = True
+        if self._settings_after:
+            self.after_cancel(self._settings_after)
+
+        self._settings_after = self.after(delay, self._flush_settings)
+
+    def _flush_settings(self) -> None:
+        """Writes the settings to the settings.json file if they have changed, replacing it atomically so a crash can not leave a torn file.
+        """
+        if self._settings_after:
+            self.after_cancel(self._settings_after)
+            self._settings_after = None
+
+        if not self._settings_dirty:
+            return
+
+        with open("settings.json.tmp", "w") as file:
+            json.dump(SETTINGS, file, indent=4)
+
+        os.replace("settings.json.tmp", "settings.json")
+        self._settings_dirty = False
 
     def adjust_volume(self, value: str) -> None:
         """Adjusts the volume of the audio playback based on the given value from the volume slider.
@@ -602,11 +984,11 @@ class Player(tkinter.Tk):
         self.volume = int(value)
         if self.volume == 0:
             self.is_muted = True
-            self.muted_unmuted.config(image=self.LIGHT_MODE_MUTED if self.mode == "light_mode" else self.DARK_MODE_MUTED)
+            self.muted_unmuted.config(image=self.theme["MUTED"])
         
         elif self.volume > 1:
             self.is_muted = False
-            self.muted_unmuted.config(image=self.LIGHT_MODE_UNMUTED if self.mode == "light_mode" else self.DARK_MODE_UNMUTED)
+            self.muted_unmuted.config(image=self.theme["UNMUTED"])
         
         self.mixer.set_volume(self.volume / 100)
         self.updating_volume()
@@ -617,55 +999,112 @@ class Player(tkinter.Tk):
         if self.now_playing:
             if self.show_artwork:
                 self.show_artwork = False
-                self.artwork.configure(image=self.LIGHT_MODE_ALT_ARTWORK if self.mode == "light_mode" else self.DARK_MODE_ALT_ARTWORK, background="white" if self.mode == "light_mode" else "black", activebackground="black" if self.mode == "light_mode" else "white")
+                self.artwork.configure(image=self.theme["ALT_ARTWORK"], background="white" if self._is_light else "black", activebackground="black" if self._is_light else "white")
                 return
             
             _, now_playing_info = self.get_now_playing()
             self.show_artwork = True
-            self.artwork.configure(image=now_playing_info["artwork"])
+            self.artwork.configure(image=self._get_artwork(now_playing_info))
 
     def reorder_now_playing(self) -> None:
-        """Reorders the tracks displayed in the UI based on the current state of the playlist and highlights the currently playing track.
+        """Schedules the tracks displayed in the UI to be rebuilt from the current order of the playlist once the event loop is idle,
+        so a burst of changes is only drawn once. Only needed when the order or number of tracks has changed, see mark_now_playing
+        for track changes.
         """
+        if self._reorder_pending:
+            return
+
+        self._reorder_pending = True
+        self.after_idle(self._redraw_tracks)
+
+    def _redraw_tracks(self) -> None:
+        """Rebuilds the tracks displayed in the UI from the current order of the playlist and highlights the currently playing track.
+        """
+        self._reorder_pending = False
+        self._now_playing_row = None
+        if self.now_playing:
+            index, now_playing_info = self.get_now_playing()
+            if self.playlist.get(index) is now_playing_info:
+                self._now_playing_row = index
+
+        rows = [self.track_string(index, track_info, now_playing=index == self._now_playing_row) for index, track_info in self.playlist.items()]
+
+        # A single insert call sends every row to Tk in one command
         self.tracks.delete(0, tkinter.END)
-        playlist = self.playlist.copy()
-        self.playlist.clear()
-        for track_index, pair in enumerate(playlist.items()):
-            key, value = pair
-            track_string = f"{track_index + 1}. " + (f"{value['title'] or ''}") + (f" - {value['album']}" if value['album'] else '') + (f" - {value['artist'] if value['artist'] else ''}")
-            
-            if self.now_playing:
-                _, now_playing_info = self.get_now_playing()
-                now_playing_track_string = f"{track_index + 1}. [Now Playing]: " + (f"{now_playing_info['title'] or ''}") + (f" - {now_playing_info['album']}" if now_playing_info['album'] else '') + (f" - {now_playing_info['artist'] if now_playing_info['artist'] else ''}")
-                self.tracks.insert(key, track_string if playlist[key] != now_playing_info else now_playing_track_string)
-                if playlist[key] == now_playing_info:
-                    self.now_playing.clear()
-                    self.now_playing[track_index] = now_playing_info
-            else:
-                self.tracks.insert(track_index, track_string)
-            
-            
-            self.playlist[track_index] = value
+        if rows:
+            self.tracks.insert(0, *rows)
         
         if len(self.playlist) == 0 and self.now_playing:
             self.now_playing.clear()
             self.set_to_default()
             self.mixer.unload()
             self.mixer.stop()
+
+    def reindex_playlist(self, tracks: typing.Iterable[dict] | None = None) -> None:
+        """Renumbers the playlist from 0 in the given order, keeping the now playing index pointed at its track.
+
+        Args:
+            tracks (typing.Iterable[dict] | None): The tracks in their new order. Defaults to None, which keeps the current order.
+        """
+        self.playlist = dict(enumerate(self.playlist.values() if tracks is None else tracks))
+        self._path_to_key = {track_info["path_key"]: index for index, track_info in self.playlist.items()}
+        if not self.now_playing:
+            return
+
+        _, now_playing_info = self.get_now_playing()
+        index = self._path_to_key.get(now_playing_info["path_key"])
+        if index is not None:
+            self.now_playing.clear()
+            self.now_playing[index] = now_playing_info
+
+        self._requeue_following_track()
+
+    def mark_now_playing(self, index: int) -> None:
+        """Moves the now playing highlight in the UI to the given track, rewriting only the previous and new now playing rows.
+
+        Args:
+            index (int): The index of the now playing track in the playlist.
+        """
+        # A pending redraw rebuilds every row, including the highlight, from the playlist
+        if self._reorder_pending:
+            return
+
+        previous_row = self._now_playing_row
+        if previous_row is not None and previous_row != index and previous_row in self.playlist:
+            self.tracks.delete(previous_row)
+            self.tracks.insert(previous_row, self.track_string(previous_row, self.playlist[previous_row]))
+
+        self.tracks.delete(index)
+        self.tracks.insert(index, self.track_string(index, self.playlist[index], now_playing=True))
+        self._now_playing_row = index
+
+    def track_string(self, index: int, track_info: dict, now_playing: bool = False) -> str:
+        """Builds the text displayed in the tracks listbox for a track.
+
+        Args:
+            index (int): The index of the track in the playlist.
+            track_info (dict): A dictionary containing the track's metadata, including its display text.
+            now_playing (bool): Whether the track is the currently playing track. Defaults to False.
+
+        Returns:
+            str: The text of the track's row.
+        """
+        if now_playing:
+            return f"{index + 1}. [Now Playing]: {track_info['display']}"
+
+        return f"{index + 1}. {track_info['display']}"
             
     def set_to_default(self) -> None:
         """Resets the UI elements to their default states.
         """
-        try:
-            self.after_cancel(self.repeater)
-        except AttributeError:
-            ...
-
+        self.is_playing = False
         self.track_progress = 0
         self.track_duration = 0
+        self.seek_offset = 0
+        self._queued = None
 
-        self.artwork.configure(image=self.LIGHT_MODE_ALT_ARTWORK if self.mode == "light_mode" else self.DARK_MODE_ALT_ARTWORK)
-        self.play_pause_button.configure(image=self.LIGHT_MODE_PLAY if self.mode == "light_mode" else self.DARK_MODE_PLAY)
+        self.artwork.configure(image=self.theme["ALT_ARTWORK"])
+        self.play_pause_button.configure(image=self.theme["PLAY"])
         self.track_title.configure(text="Title")
         self.track_artist.configure(text="Artist")
         self.track_position.configure(value=self.track_progress)
@@ -688,11 +1127,10 @@ class Player(tkinter.Tk):
         """
         if 0 <= event.x <= 396 and self.now_playing:
             _, now_playing_info = self.get_now_playing()
-            for coordinate_index in now_playing_info["coordinates"]:
-                min_coordinate, max_coordinate = now_playing_info["coordinates"][coordinate_index]
-                if min_coordinate <= event.x <= max_coordinate:
-                    self.track_progress = coordinate_index
-                    self.mixer.set_pos(self.track_progress)
+            if now_playing_info["px_per_sec"]:
+                self.track_progress = max(0, min(int(event.x / now_playing_info["px_per_sec"]), int(self.track_duration)))
+                self.mixer.set_pos(self.track_progress)
+                self.seek_offset = self.track_progress - max(self.mixer.get_pos(), 0) / 1000
         
         if not self.is_playing:
             self.track_position.configure(value=self.track_progress)
@@ -720,166 +1158,293 @@ class Player(tkinter.Tk):
         
         self.can_reorder = False
         index = self.tracks.nearest(event.y)
-        update_tracks = False
-        if index < self.selected_index:
-
+        if index != self.selected_index:
             self.playlist.update({
                 index: self.playlist[self.selected_index],
                 self.selected_index: self.playlist[index]
             })
-
-            track = self.tracks.get(index)
-            self.tracks.delete(index)
-            self.tracks.insert(index + 1, track)
             self.selected_index = index
-            update_tracks = True
-
-        elif index > self.selected_index:
 
-            self.playlist.update({
-                index: self.playlist[self.selected_index],
-                self.selected_index: self.playlist[index]
-            })
-
-            track = self.tracks.get(index)
-            self.tracks.delete(index)
-            self.tracks.insert(index - 1, track)
-            self.selected_index = index
-            update_tracks = True
-        
-        if update_tracks:
-            self.reorder_now_playing()
+            # Drag events arrive far faster than the listbox can be redrawn, so the redraw is done once per idle cycle
+            if not self._swap_scheduled:
+                self._swap_scheduled = True
+                self.after_idle(self._commit_swap)
         
         self.can_reorder = True
+
+    def _commit_swap(self) -> None:
+        """Redraws the playlist once after the swaps made by the drag events since the last idle cycle.
+        """
+        self._swap_scheduled = False
+        self.reindex_playlist()
+        self.reorder_now_playing()
     
     def remove_tracks(self) -> None:
         """Opens a file dialog for the user to select audio tracks to remove, and then deletes the selected files from the filesystem.
+        Tracks that are referenced in place are only removed from the playlist, the original files are left untouched.
         """
         file_paths = filedialog.askopenfilenames(title="Select Tracks", initialdir=SETTINGS["directory"], filetypes=(("MP3 Files", "*.mp3"), ("WAV Files", "*.wav"), ("OGG Files", "*.ogg")))
+        removed_references = False
         for file_path in file_paths:
-            pathlib.Path(file_path).unlink(missing_ok=True)
+            path_key = self._path_key(file_path)
+            key = self._path_to_key.get(path_key)
+            if key is None or self.playlist[key]["path"] not in SETTINGS["references"]:
+                pathlib.Path(file_path).unlink(missing_ok=True)
+                continue
+
+            SETTINGS["references"].remove(self.playlist.pop(key)["path"])
+            del self._path_to_key[path_key]
+            removed_references = True
+
+        if removed_references:
+            self.save_settings()
+            self.reindex_playlist()
+            self.reorder_now_playing()
 
     def add_tracks(self) -> None:
-        """Opens a file dialog for the user to select audio tracks to add to the playlist, and copies the selected files to the tracks directory.
+        """Opens a file dialog for the user to select audio tracks to add to the playlist. The selected files are parsed on the I/O pool,
+        then added to the playlist on the Tk thread. Depending on the import mode setting the files are either played from where they are,
+        or copied to the tracks directory first.
         """
         file_paths = filedialog.askopenfilenames(title="Select Tracks", filetypes=(("MP3 Files", "*.mp3"), ("WAV Files", "*.wav"), ("OGG Files", "*.ogg")))
-        for file_path in file_paths:
-            try:
-                shutil.copy2(file_path, pathlib.Path(SETTINGS["directory"]))
-            except shutil.SameFileError:
-                ...
+        file_paths = [pathlib.Path(file_path) for file_path in file_paths]
+        copy = SETTINGS["import_mode"] == "copy"
+        futures = [self._io_pool.submit(self._parse_track, path, copy) for path in file_paths if self._path_key(path) not in self._path_to_key]
+        for future in futures:
+            future.add_done_callback(lambda _: self.after(0, self._install_tracks, futures, not copy))
 
     def add_existing_tracks(self):
-        """Scans the tracks directory for audio files with extensions .mp3, .wav, or .ogg, and adds them to the playlist.
-        """
-        path = pathlib.Path(SETTINGS["directory"])
-        for file in path.iterdir():
-            if file.suffix in [".mp3", ".wav", ".ogg"]:
-                index = self.populate_track_info(file)
-                track_string = f"{index + 1}. " + (f"{self.playlist[index]['title'] or ''}") + (f" - {self.playlist[index]['album']}" if self.playlist[index]['album'] else '') + (f" - {self.playlist[index]['artist'] if self.playlist[index]['artist'] else ''}")
-                self.tracks.insert(index, track_string)
+        """Scans the tracks directory for audio files with extensions .mp3, .wav, or .ogg, and adds them to the playlist, followed by the
+        tracks referenced in place that still exist. The metadata is read in parallel on the I/O pool, then the tracks are added in order.
+        """
+        paths = []
+        with os.scandir(SETTINGS["directory"]) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(AUDIO_EXTENSIONS) and self._path_key(entry.path) not in self._path_to_key:
+                    paths.append(entry.path)
+
+        references = [reference for reference in SETTINGS["references"] if os.path.exists(reference) and self._path_key(reference) not in self._path_to_key]
+
+        futures = [self._io_pool.submit(self._parse_track, path) for path in paths + references]
+
+        rows = []
+        for position, future in enumerate(futures):
+            # A file that can not be read is skipped, so one bad file does not keep the rest of the library from loading
+            try:
+                track_info = future.result()
+            except (TinyTagException, OSError):
+                continue
+
+            index = self._install_track(track_info, reference=position >= len(paths))
+            if index is not None:
+                rows.append(self.track_string(index, self.playlist[index]))
+
+        self.tracks.insert(tkinter.END, *rows)
     
     def watchdog(self) -> None:
         """Monitors the tracks directory for any changes in the files present, such as additions or deletions of audio files.
         If a file has been added or removed, it updates the playlist and the UI accordingly.
         """
-        path = pathlib.Path(SETTINGS["directory"])
-        files = []
-        for file in path.iterdir():
-            if file.suffix in [".mp3", ".wav", ".ogg"]:
-                files.append(str(file))
-        
-        old = set(self.existing_tracks)
-        new = set(files)
+        # Rescheduled first, so a failed scan can not stop the polling for good
+        self.file_watcher = self.after(1000, self.watchdog)
+
+        files = set()
+        with os.scandir(SETTINGS["directory"]) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                    files.add(os.path.normpath(entry.path))
+
+        removed = self.existing_tracks - files
+        added = files - self.existing_tracks
 
         update_tracks = False
         
-        # File removed
-        if len(old) > len(new):
-            for file in self.existing_tracks:
-                file = pathlib.Path(file).as_posix().replace("/", "\\")
-                if file not in files:
-                    for key, value in self.playlist.copy().items():
-                        if file == value["path"]:
-                            self.existing_tracks.remove(file)
-                            self.playlist.pop(key)
-                            update_tracks = True
-
-        # File added
-        elif len(old) < len(new):
-            for file in files:
-                if file not in self.existing_tracks:
-                    self.populate_track_info(pathlib.Path(file))
+        # Files removed
+        for file in removed:
+            self.existing_tracks.discard(file)
+            key = self._path_to_key.pop(self._path_key(file), None)
+            if key is not None:
+                self.playlist.pop(key)
+                update_tracks = True
+
+        if update_tracks:
+            self.reindex_playlist()
+
+        # Files added
+        for file in added:
+            try:
+                if self.populate_track_info(file) is not None:
                     update_tracks = True
+            except (TinyTagException, OSError):
+                continue
     
         if update_tracks:
             self.reorder_now_playing()
-
-        self.file_watcher = self.after(1000, self.watchdog)
     
+    def watch_tracks_directory(self) -> None:
+        """Starts watching the tracks directory for added or removed audio files. Uses OS notifications through watchdog when it is
+        installed, and falls back to polling the directory every second otherwise.
+        """
+        # Changes still pending from the previous directory no longer apply
+        for pending in self._fs_pending.values():
+            self.after_cancel(pending)
+
+        self._fs_pending.clear()
+
+        if Observer is None:
+            if self.file_watcher:
+                self.after_cancel(self.file_watcher)
+                self.file_watcher = None
+
+            self.watchdog()
+            return
+
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.start()
+
+        self._observer.unschedule_all()
+        self._observer.schedule(TracksEventHandler(self), SETTINGS["directory"], recursive=False)
+
+    def handle_fs_event(self, path: str) -> None:
+        """Handles a change to an audio file in the tracks directory reported by the observer. Changes are applied once a file has
+        seen no further events for 500 ms, so files still being copied are not read early.
+
+        Args:
+            path (str): The path of the changed audio file.
+        """
+        pending = self._fs_pending.pop(path, None)
+        if pending:
+            self.after_cancel(pending)
+
+        self._fs_pending[path] = self.after(500, self._apply_fs_change, path)
+
+    def _apply_fs_change(self, path: str) -> None:
+        """Adds or removes a single track depending on whether its file still exists, without rescanning the tracks directory.
+
+        Args:
+            path (str): The path of the changed audio file.
+        """
+        self._fs_pending.pop(path, None)
+        if os.path.exists(path):
+            if path in self.existing_tracks:
+                return
+
+            # A file that can not be read is skipped until it changes again
+            try:
+                if self.populate_track_info(path) is None:
+                    return
+            except (TinyTagException, OSError):
+                return
+
+        else:
+            if path not in self.existing_tracks:
+                return
+
+            self.existing_tracks.discard(path)
+            key = self._path_to_key.pop(self._path_key(path), None)
+            if key is not None:
+                self.playlist.pop(key)
+
+            self.reindex_playlist()
+
+        self.reorder_now_playing()
+
     def toggle_mode(self) -> None:
-        """Toggles the application's theme between light and dark modes.
+        """Toggles the application's theme between light and dark modes. The mode setter applies the new theme.
         """
-        if self.mode == "light_mode":
-            self.mode = "dark_mode"
-        
-        elif self.mode == "dark_mode":
-            self.mode = "light_mode"
+        self.mode = Mode.DARK_MODE if self._is_light else Mode.LIGHT_MODE
 
     def update_theme(self) -> None:
         """Updates the theme of the application based on the current mode.
+
+        Does nothing if the current mode has already been applied, and skips widgets that are already themed for it.
         """
-        self.configure(background="white" if self.mode == "light_mode" else "#2F3136")
+        mode = self.mode
+        if self._themed_mode_applied == mode:
+            return
+
+        colors = self.colors
+        handlers = self._theme_handlers
+
+        self.configure(background=colors["background"])
+        # The settings window stays alive while hidden and keeps its own palette, so only the main window's canvases are themed
         for widget in self.winfo_children():
-            if isinstance(widget, tkinter.Canvas) or isinstance(widget, tkinter.Toplevel):
-                widget.configure(background="white" if self.mode == "light_mode" else "#2F3136", borderwidth=0, highlightthickness=0)
+            if isinstance(widget, tkinter.Canvas):
+                if getattr(widget, "_applied_mode", None) != mode:
+                    widget.configure(background=colors["background"], borderwidth=0, highlightthickness=0)
+                    widget._applied_mode = mode
+
                 for child in widget.winfo_children():
-                    if isinstance(child, tkinter.Listbox):
-                        child.configure(background="white" if self.mode == "light_mode" else "#2F3136", foreground="black" if self.mode == "light_mode" else "white", highlightcolor="grey" if self.mode == "light_mode" else "white", selectforeground='black' if self.mode == "light_mode" else "white", selectbackground='white' if self.mode == "light_mode" else "#2F3136")
-                    
-                    elif isinstance(child, tkinter.Button):
-                        child_name = child.winfo_name()
-                        if child_name in ["add", "remove"]:
-                            child.configure(foreground="black" if self.mode == "light_mode" else "white", background="white" if self.mode == "light_mode" else "#2F3136", activebackground="white" if self.mode == "light_mode" else "#2F3136", activeforeground="black" if self.mode == "light_mode" else "white")
-                            continue
-
-                        child.configure(background="white" if self.mode == "light_mode" else "#2F3136", borderwidth=0, highlightthickness=0, highlightcolor="black" if self.mode == "light_mode" else "white", activebackground="white" if self.mode == "light_mode" else "#2F3136")
-
-                        if child_name == "dark_light":
-                            child.configure(image=self.LIGHT_MODE_LIGHT if self.mode == "light_mode" else self.DARK_MODE_DARK, background="white" if self.mode == "light_mode" else "#2F3136")
-                        
-                        elif child_name in ["play_pause", "muted_unmuted"]:
-                            if child_name == "play_pause":
-                                if not self.is_playing:
-                                    self.play_pause_button.configure(image=self.LIGHT_MODE_PLAY if self.mode == "light_mode" else self.DARK_MODE_PLAY, background="white" if self.mode == "light_mode" else "#2F3136")
-                                
-                                else:
-                                    self.play_pause_button.configure(image=self.LIGHT_MODE_PAUSE if self.mode == "light_mode" else self.DARK_MODE_PAUSE, background="white" if self.mode == "light_mode" else "#2F3136")
-                            
-                            else:
-                                if self.is_muted:
-                                    self.muted_unmuted.config(image=self.LIGHT_MODE_MUTED if self.mode == "light_mode" else self.DARK_MODE_MUTED)
-
-                                else:
-                                    self.muted_unmuted.config(image=self.LIGHT_MODE_UNMUTED if self.mode == "light_mode" else self.DARK_MODE_UNMUTED)
-
-                        elif child_name == "artwork":
-                            if not self.show_artwork:
-                                child.configure(image=self.LIGHT_MODE_ALT_ARTWORK if self.mode == "light_mode" else self.DARK_MODE_ALT_ARTWORK, background="white" if self.mode == "light_mode" else "#2F3136")
-
-                        else:
-                            child.configure(image=getattr(self, f"{self.mode}_{child_name}".upper()))
-
-                    elif isinstance(child, tkinter.Label):
-                        child.configure(background="white" if self.mode == "light_mode" else "#2F3136", foreground="black" if self.mode == "light_mode" else "white")
-                    
-                    elif isinstance(child, tkinter.Scale):
-                        child.configure(background="white" if self.mode == "light_mode" else "#2F3136", troughcolor="lightgrey", activebackground="white" if self.mode == "light_mode" else "#2F3136", borderwidth=0, highlightthickness=0, foreground="black" if self.mode == "light_mode" else "white")
+                    handler = handlers.get(type(child))
+                    if handler and getattr(child, "_applied_mode", None) != mode:
+                        handler(child, colors)
+                        child._applied_mode = mode
+
+        self._themed_mode_applied = mode
+
+    def _theme_listbox(self, child: tkinter.Listbox, colors: dict) -> None:
+        """Applies the theme colors to a listbox.
+
+        Args:
+            child (tkinter.Listbox): The listbox to theme.
+            colors (dict): The colors of the current theme mode.
+        """
+        child.configure(background=colors["background"], foreground=colors["foreground"], highlightcolor=colors["listbox_highlight"], selectforeground=colors["foreground"], selectbackground=colors["background"])
+
+    def _theme_button(self, child: tkinter.Button, colors: dict) -> None:
+        """Applies the theme colors and images to a button, picking the image from the button's name and the player's state.
+
+        Args:
+            child (tkinter.Button): The button to theme.
+            colors (dict): The colors of the current theme mode.
+        """
+        child_name = child._name
+        if child_name in ["add", "remove"]:
+            child.configure(foreground=colors["foreground"], background=colors["background"], activebackground=colors["background"], activeforeground=colors["foreground"])
+            return
+
+        opts = {"background": colors["background"], "borderwidth": 0, "highlightthickness": 0, "highlightcolor": colors["foreground"], "activebackground": colors["background"]}
+        if child_name == "dark_light":
+            opts["image"] = self.theme["DARK_LIGHT"]
+
+        elif child_name == "play_pause":
+            opts["image"] = self.theme["PAUSE"] if self.is_playing else self.theme["PLAY"]
+
+        elif child_name == "muted_unmuted":
+            opts["image"] = self.theme["MUTED"] if self.is_muted else self.theme["UNMUTED"]
+
+        elif child_name == "artwork":
+            if not self.show_artwork:
+                opts["image"] = self.theme["ALT_ARTWORK"]
+
+        else:
+            opts["image"] = self.theme[child_name.upper()]
+
+        child.configure(**opts)
+
+    def _theme_label(self, child: tkinter.Label, colors: dict) -> None:
+        """Applies the theme colors to a label.
+
+        Args:
+            child (tkinter.Label): The label to theme.
+            colors (dict): The colors of the current theme mode.
+        """
+        child.configure(background=colors["background"], foreground=colors["foreground"])
+
+    def _theme_scale(self, child: tkinter.Scale, colors: dict) -> None:
+        """Applies the theme colors to a scale.
+
+        Args:
+            child (tkinter.Scale): The scale to theme.
+            colors (dict): The colors of the current theme mode.
+        """
+        child.configure(background=colors["background"], troughcolor=colors["trough"], activebackground=colors["background"], borderwidth=0, highlightthickness=0, foreground=colors["foreground"])
 
     def close_settings(self):
-        """Closes the settings window and cleans up the reference."""
-        self.settings_window.destroy()
-        del self.settings_window
+        """Hides the settings window, keeping its widgets for the next time it is opened."""
+        self.settings_window.grab_release()
+        self.settings_window.withdraw()
     
     def update_default_theme(self) -> None:
         """Updates the default theme of the application based on the current mode.
@@ -888,13 +1453,8 @@ class Player(tkinter.Tk):
         if selection == SETTINGS["theme"]:
             return
         
-        try:
-            with open("settings.json", "w") as file:
-                SETTINGS["theme"] = selection
-                json.dump(SETTINGS, file, indent=4)
-        except KeyError:
-            self.load_backup()
-            self.update_default_theme()
+        SETTINGS["theme"] = selection
+        self.save_settings(delay=500)
     
     def update_tracks_directory(self) -> None:
         """Updates the tracks directory of the application based on the selected directory.
@@ -906,25 +1466,27 @@ class Player(tkinter.Tk):
         self.now_playing.clear()
         self.playlist.clear()
         self.existing_tracks.clear()
+        self._path_to_key.clear()
 
         self.set_to_default()
         self.mixer.unload()
         self.mixer.stop()
 
         self.reorder_now_playing()
-        try:
-            with open("settings.json", "w") as file:
-                SETTINGS["directory"] = directory
-                json.dump(SETTINGS, file, indent=4)
-        except KeyError:
-            self.load_backup()
-            self.update_tracks_directory()
+        SETTINGS["directory"] = directory
+        self.save_settings(delay=500)
+
+        self.add_existing_tracks()
+        self.watch_tracks_directory()
         
 
     def open_settings(self) -> None:
         """Opens the settings window for the application.
         """
-        if hasattr(self, 'settings_window') and self.settings_window.winfo_exists():
+        if self.settings_window is not None and self.settings_window.winfo_exists():
+            self._default_directory_label.configure(text=pathlib.Path(SETTINGS["directory"]).absolute())
+            self.settings_window.deiconify()
+            self.settings_window.grab_set()
             self.settings_window.lift()
 
         else:
@@ -951,17 +1513,17 @@ class Player(tkinter.Tk):
             default_theme_canvas = tkinter.Canvas(self.settings_window, background="darkgrey", borderwidth=0, highlightthickness=0)
             default_theme_canvas.grid(row=1, column=1, padx=(48, 0))
 
-            default_theme_label = tkinter.Label(default_theme_canvas, text="Set Default Theme:", font=("Times New Roman", 18, "bold"), background="darkgrey", borderwidth=0, highlightthickness=0)
+            default_theme_label = tkinter.Label(default_theme_canvas, text="Set Default Theme:", font=self.FONT_BOLD_18, background="darkgrey", borderwidth=0, highlightthickness=0)
             default_theme_label.grid(row=2, column=1)
 
-            light_mode_button = tkinter.Radiobutton(default_theme_canvas, justify="center", text="Light Theme", variable=self.startup_theme, value=1, command=self.update_default_theme, font=("Times New Roman", 12, "bold"), background="darkgrey", borderwidth=0, highlightthickness=0, activebackground="darkgrey")
+            light_mode_button = tkinter.Radiobutton(default_theme_canvas, justify="center", text="Light Theme", variable=self.startup_theme, value=1, command=self.update_default_theme, font=self.FONT_BOLD_12, background="darkgrey", borderwidth=0, highlightthickness=0, activebackground="darkgrey")
             light_mode_button.grid(row=3, column=1)
 
-            dark_mode_button = tkinter.Radiobutton(default_theme_canvas, justify="center", text="Dark Theme", variable=self.startup_theme, value=2, command=self.update_default_theme, font=("Times New Roman", 12, "bold"), background="darkgrey", borderwidth=0, highlightthickness=0, activebackground="darkgrey")
+            dark_mode_button = tkinter.Radiobutton(default_theme_canvas, justify="center", text="Dark Theme", variable=self.startup_theme, value=2, command=self.update_default_theme, font=self.FONT_BOLD_12, background="darkgrey", borderwidth=0, highlightthickness=0, activebackground="darkgrey")
             dark_mode_button.grid(row=4, column=1)
 
-            default_directory_label = tkinter.Label(default_theme_canvas, text=pathlib.Path(SETTINGS["directory"]).absolute(), background="darkgrey", font=("Times New Roman", 12, "bold"), wraplength=200)
-            default_directory_label.grid(row=7, column=1)
+            self._default_directory_label = tkinter.Label(default_theme_canvas, text=pathlib.Path(SETTINGS["directory"]).absolute(), background="darkgrey", font=self.FONT_BOLD_12, wraplength=200)
+            self._default_directory_label.grid(row=7, column=1)
 
             default_directory_button = tkinter.Button(default_theme_canvas, text="Set Default Directory", command=self.update_tracks_directory)
             default_directory_button.grid(pady=(48, 0), sticky="nswe", column=1, row=6)
@@ -977,13 +1539,13 @@ class Player(tkinter.Tk):
         tracks_canvas = tkinter.Canvas(self)
         tracks_canvas.grid(row=0, column=0, rowspan=16, sticky="wns")
 
-        add_tracks_button = tkinter.Button(tracks_canvas, name="add", text="Add Track", font=("Times New Roman", 12, "bold"), command=self.add_tracks)
+        add_tracks_button = tkinter.Button(tracks_canvas, name="add", text="Add Track", font=self.FONT_BOLD_12, command=self.add_tracks)
         add_tracks_button.grid(pady=(10, 5), padx=(10, 0), sticky="nswe", column=0)
 
-        remove_tracks_button = tkinter.Button(tracks_canvas, name="remove", text="Remove Track", font=("Times New Roman", 12, "bold"), command=self.remove_tracks)
+        remove_tracks_button = tkinter.Button(tracks_canvas, name="remove", text="Remove Track", font=self.FONT_BOLD_12, command=self.remove_tracks)
         remove_tracks_button.grid(pady=(5, 0), padx=(10, 0), sticky="nswe", column=0, row=16)
 
-        self.tracks = tkinter.Listbox(tracks_canvas, font=("Times New Roman", 12), width=24, height=22, selectmode="single", background="white" if self.mode == "light_mode" else "black", foreground="black" if self.mode == "light_mode" else "white", highlightcolor="grey" if self.mode == "light_mode" else "white", selectforeground='black' if self.mode == "light_mode" else "white", selectbackground='white' if self.mode == "light_mode" else "black")
+        self.tracks = tkinter.Listbox(tracks_canvas, font=self.FONT_12, width=24, height=22, selectmode="single", background="white" if self._is_light else "black", foreground="black" if self._is_light else "white", highlightcolor="grey" if self._is_light else "white", selectforeground='black' if self._is_light else "white", selectbackground='white' if self._is_light else "black")
         self.tracks.grid(row=1, rowspan=13, padx=(8, 0), sticky="nsw")
         self.tracks.bind("<Double-Button-1>", self.play_selected_track)
         self.tracks.bind('<Button-1>', self.select_track)
@@ -1003,7 +1565,7 @@ class Player(tkinter.Tk):
         artwork_canvas = tkinter.Canvas(self)
         artwork_canvas.grid(row=0, column=1, rowspan=7, columnspan=7, sticky="nswe", padx=(24, 0), pady=(32, 0))
         
-        self.artwork = tkinter.Button(artwork_canvas, name="artwork", image=self.LIGHT_MODE_ALT_ARTWORK if self.mode == "light_mode" else self.DARK_MODE_ALT_ARTWORK, command=self.toggle_artwork, anchor="center", relief="flat")
+        self.artwork = tkinter.Button(artwork_canvas, name="artwork", image=self.theme["ALT_ARTWORK"], command=self.toggle_artwork, anchor="center", relief="flat")
         self.artwork.pack(expand=True)
 
         # ------------------------------------------ #
@@ -1013,10 +1575,10 @@ class Player(tkinter.Tk):
         track_info_canvas = tkinter.Canvas(self)
         track_info_canvas.grid(row=8, column=1, columnspan=7, sticky="wnse", pady=(8, 8), padx=(32, 0))
 
-        self.track_title = tkinter.Label(track_info_canvas, text="Title", font=("Times New Roman", 12, "bold"), wraplength=512)
+        self.track_title = tkinter.Label(track_info_canvas, text="Title", font=self.FONT_BOLD_12, wraplength=512)
         self.track_title.grid(row=0)
 
-        self.track_artist = tkinter.Label(track_info_canvas, text="Artist", font=("Times New Roman", 12))
+        self.track_artist = tkinter.Label(track_info_canvas, text="Artist", font=self.FONT_12)
         self.track_artist.grid(row=1)
 
         self.track_position = ttk.Progressbar(track_info_canvas, orient="horizontal", mode="determinate", length=396, variable=self.track_progress)
@@ -1024,7 +1586,7 @@ class Player(tkinter.Tk):
 
         self.track_position.bind('<Button-1>', self.set_track_position)
 
-        self.track_duration_text = tkinter.Label(track_info_canvas, text="00:00:00", font=("Times New Roman", 12, "bold"))
+        self.track_duration_text = tkinter.Label(track_info_canvas, text="00:00:00", font=self.FONT_BOLD_12)
         self.track_duration_text.grid(row=3)
 
         # ------------------------------------------ #
@@ -1034,25 +1596,25 @@ class Player(tkinter.Tk):
         track_buttons_canvas = tkinter.Canvas(self)
         track_buttons_canvas.grid(row=9, column=4, sticky="nsew", padx=(32, 32))
 
-        self.shuffle_button = tkinter.Button(track_buttons_canvas, name="shuffle", command=self.shuffle_tracks, image=self.LIGHT_MODE_SHUFFLE if self.mode == "light_mode" else self.DARK_MODE_SHUFFLE)
+        self.shuffle_button = tkinter.Button(track_buttons_canvas, name="shuffle", command=self.shuffle_tracks, image=self.theme["SHUFFLE"])
         self.shuffle_button.grid(column=0, row=1, padx=(24, 8))
 
-        decrease = tkinter.Button(track_buttons_canvas, name="decrease", command=self.decrease_volume, image=self.LIGHT_MODE_DECREASE if self.mode == "light_mode" else self.DARK_MODE_DECREASE)
+        decrease = tkinter.Button(track_buttons_canvas, name="decrease", command=self.decrease_volume, image=self.theme["DECREASE"])
         decrease.grid(column=1, row=1, padx=(16, 8))
 
-        self.previous_button = tkinter.Button(track_buttons_canvas, name="previous",  command=self.previous, image=self.LIGHT_MODE_PREVIOUS if self.mode == "light_mode" else self.DARK_MODE_PREVIOUS)
+        self.previous_button = tkinter.Button(track_buttons_canvas, name="previous",  command=self.previous, image=self.theme["PREVIOUS"])
         self.previous_button.grid(column=2, row=1, padx=(16, 8))
 
-        self.play_pause_button = tkinter.Button(track_buttons_canvas, name="play_pause",  command=self.toggle_playback, image=self.LIGHT_MODE_PLAY if self.mode == "light_mode" else self.DARK_MODE_PLAY)
+        self.play_pause_button = tkinter.Button(track_buttons_canvas, name="play_pause",  command=self.toggle_playback, image=self.theme["PLAY"])
         self.play_pause_button.grid(column=3, row=1, padx=(16, 8))
 
-        self.next_button = tkinter.Button(track_buttons_canvas, name="next",  command=self.next,  image=self.LIGHT_MODE_NEXT if self.mode == "light_mode" else self.DARK_MODE_NEXT)
+        self.next_button = tkinter.Button(track_buttons_canvas, name="next",  command=self.next,  image=self.theme["NEXT"])
         self.next_button.grid(column=4, row=1, padx=(16, 8))
 
-        increase = tkinter.Button(track_buttons_canvas, name="increase",  command=self.increase_volume, image=self.LIGHT_MODE_INCREASE if self.mode == "light_mode" else self.DARK_MODE_INCREASE)
+        increase = tkinter.Button(track_buttons_canvas, name="increase",  command=self.increase_volume, image=self.theme["INCREASE"])
         increase.grid(column=5, row=1, padx=(16, 8))
 
-        self.repeat_button = tkinter.Button(track_buttons_canvas, name="repeat",  command=self.update_repeat,  image=self.LIGHT_MODE_REPEAT if self.mode == "light_mode" else self.DARK_MODE_REPEAT)
+        self.repeat_button = tkinter.Button(track_buttons_canvas, name="repeat",  command=self.update_repeat,  image=self.theme["REPEAT"])
         self.repeat_button.grid(column=6, row=1, padx=(16, 8))
 
         # ------------------------------------------ #
@@ -1062,7 +1624,7 @@ class Player(tkinter.Tk):
         audio_buttons_canvas = tkinter.Canvas(self)
         audio_buttons_canvas.grid(row=10, column=3, columnspan=4)
 
-        self.muted_unmuted = tkinter.Button(audio_buttons_canvas, name="muted_unmuted",  command=self.toggle_mute, image=self.LIGHT_MODE_UNMUTED if self.mode == "light_mode" else self.DARK_MODE_UNMUTED)
+        self.muted_unmuted = tkinter.Button(audio_buttons_canvas, name="muted_unmuted",  command=self.toggle_mute, image=self.theme["UNMUTED"])
         self.muted_unmuted.grid(column=0, row=0, padx=(8, 48), pady=(16, 0))
 
         self.volume_slider = tkinter.Scale(audio_buttons_canvas, from_=0, to=100, command=self.adjust_volume, orient="horizontal", length=264)
@@ -1076,7 +1638,7 @@ class Player(tkinter.Tk):
         dark_light_button_canvas = tkinter.Canvas(self)
         dark_light_button_canvas.grid(row=15, rowspan=16, column=12, sticky="se")
 
-        self.dark_light_button = tkinter.Button(dark_light_button_canvas, name="dark_light", command=self.toggle_mode, image=self.LIGHT_MODE_LIGHT if self.mode == "light_mode" else self.DARK_MODE_DARK, relief="flat")
+        self.dark_light_button = tkinter.Button(dark_light_button_canvas, name="dark_light", command=self.toggle_mode, image=self.theme["DARK_LIGHT"], relief="flat")
         self.dark_light_button.grid(column=0, row=0, padx=(56, 0), pady=(0, 8))
 
         # ------------------------------------------ #
@@ -1086,10 +1648,10 @@ class Player(tkinter.Tk):
         settings_button_canvas = tkinter.Canvas(self)
         settings_button_canvas.grid(row=0, rowspan=1, column=11, columnspan=12, sticky="se")
 
-        self.settings_button = tkinter.Button(settings_button_canvas, name="settings", command=self.open_settings, image=self.LIGHT_MODE_SETTINGS if self.mode == "light_mode" else self.DARK_MODE_SETTINGS, relief="flat")
+        self.settings_button = tkinter.Button(settings_button_canvas, name="settings", command=self.open_settings, image=self.theme["SETTINGS"], relief="flat")
         self.settings_button.grid(row=0, column=1, padx=(0, 8), pady=(0, 192))
 
-        self.website_button = tkinter.Button(settings_button_canvas, name="browser", image=self.LIGHT_MODE_BROWSER if self.mode == "light_mode" else self.DARK_MODE_BROWSER, command=lambda: webbrowser.open_new(r"https://github.com/rxality/RePlay"))
+        self.website_button = tkinter.Button(settings_button_canvas, name="browser", image=self.theme["BROWSER"], command=lambda: webbrowser.open_new(r"https://github.com/rxality/RePlay"))
         self.website_button.grid(row=0, column=0, padx=(0, 24), pady=(0, 192))
 
         # ------------------------------------------ #
@@ -1099,6 +1661,22 @@ class Player(tkinter.Tk):
         self.update_theme()
         self.backup_settings()
 
+    def destroy(self) -> None:
+        """Stops the periodic tick and writes any pending settings changes before destroying the window.
+        """
+        self.after_cancel(self._tick)
+        if self.file_watcher:
+            self.after_cancel(self.file_watcher)
+
+        for pending in self._fs_pending.values():
+            self.after_cancel(pending)
+
+        if self._observer is not None:
+            self._observer.stop()
+
+        self._flush_settings()
+        super().destroy()
+
     def run(self):
         """Starts the application's main event loop.
         """